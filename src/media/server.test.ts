@@ -48,11 +48,42 @@ describe("media server", () => {
     const port = (server.address() as AddressInfo).port;
     const res = await fetch(`http://localhost:${port}/media/file1`);
     expect(res.status).toBe(200);
+    expect(res.headers.get("content-type")).toBe("application/octet-stream");
+    expect(res.headers.get("content-length")).toBe("5");
     expect(await res.text()).toBe("hello");
     await waitForFileRemoval(file);
     await new Promise((r) => server.close(r));
   });
 
+  it("streams media larger than the sniff window", async () => {
+    const file = path.join(MEDIA_DIR, "large.png");
+    const png = Buffer.from([0x89, 0x50, 0x4e, 0x47, 0x0d, 0x0a, 0x1a, 0x0a]);
+    const body = Buffer.concat([png, Buffer.alloc(64 * 1024, 1)]);
+    await fs.writeFile(file, body);
+    const server = await startMediaServer(0, 5_000);
+    const port = (server.address() as AddressInfo).port;
+    const res = await fetch(`http://localhost:${port}/media/large.png`);
+    expect(res.status).toBe(200);
+    expect(res.headers.get("content-type")).toBe("image/png");
+    expect(res.headers.get("content-length")).toBe(String(body.length));
+    expect(Buffer.from(await res.arrayBuffer()).equals(body)).toBe(true);
+    await waitForFileRemoval(file);
+    await new Promise((r) => server.close(r));
+  });
+
+  it("serves empty media with an octet-stream type", async () => {
+    const file = path.join(MEDIA_DIR, "empty");
+    await fs.writeFile(file, "");
+    const server = await startMediaServer(0, 5_000);
+    const port = (server.address() as AddressInfo).port;
+    const res = await fetch(`http://localhost:${port}/media/empty`);
+    expect(res.status).toBe(200);
+    expect(res.headers.get("content-type")).toBe("application/octet-stream");
+    expect(await res.text()).toBe("");
+    await waitForFileRemoval(file);
+    await new Promise((r) => server.close(r));
+  });
+
   it("expires old media", async () => {
     const file = path.join(MEDIA_DIR, "old");
     await fs.writeFile(file, "stale");
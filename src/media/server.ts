@@ -1,6 +1,7 @@
 import type { Server } from "node:http";
 import express, { type Express } from "express";
 import fs from "node:fs/promises";
+import { pipeline } from "node:stream/promises";
 import { danger } from "../globals.js";
 import { SafeOpenError, openFileWithinRoot } from "../infra/fs-safe.js";
 import { defaultRuntime, type RuntimeEnv } from "../runtime.js";
@@ -11,6 +12,8 @@ const DEFAULT_TTL_MS = 2 * 60 * 1000;
 const MAX_MEDIA_ID_CHARS = 200;
 const MEDIA_ID_PATTERN = /^[\p{L}\p{N}._-]+$/u;
 const MAX_MEDIA_BYTES = MEDIA_MAX_BYTES;
+// file-type recognizes common formats from the leading 4100 bytes.
+const MIME_SNIFF_BYTES = 4100;
 
 const isValidMediaId = (id: string) => {
   if (!id) {
@@ -28,7 +31,7 @@ const isValidMediaId = (id: string) => {
 export function attachMediaRoutes(
   app: Express,
   ttlMs = DEFAULT_TTL_MS,
-  _runtime: RuntimeEnv = defaultRuntime,
+  runtime: RuntimeEnv = defaultRuntime,
 ) {
   const mediaDir = getMediaDir();
 
@@ -54,19 +57,33 @@ export function attachMediaRoutes(
         res.status(410).send("expired");
         return;
       }
-      const data = await handle.readFile();
-      await handle.close().catch(() => {});
-      const mime = await detectMime({ buffer: data, filePath: realPath });
-      if (mime) {
-        res.type(mime);
-      }
-      res.send(data);
+      // Sniff from the head only and stream the body so large media never
+      // gets buffered in memory.
+      const head = Buffer.alloc(Math.min(stat.size, MIME_SNIFF_BYTES));
+      const { bytesRead } = await handle.read(head, 0, head.length, 0);
+      const mime = await detectMime({ buffer: head.subarray(0, bytesRead), filePath: realPath });
+      res.type(mime ?? "application/octet-stream");
+      res.setHeader("Content-Length", String(stat.size));
       // best-effort single-use cleanup after response ends
       res.on("finish", () => {
         setTimeout(() => {
           fs.rm(realPath).catch(() => {});
         }, 50);
       });
+      if (stat.size === 0) {
+        await handle.close().catch(() => {});
+        res.end();
+        return;
+      }
+      try {
+        // Bound the read to the stat'd size so the body matches Content-Length.
+        await pipeline(handle.createReadStream({ start: 0, end: stat.size - 1 }), res);
+      } catch (err) {
+        // Headers are already sent; client aborts surface as premature close.
+        if ((err as NodeJS.ErrnoException).code !== "ERR_STREAM_PREMATURE_CLOSE") {
+          runtime.error(danger(`Media stream failed for ${id}: ${String(err)}`));
+        }
+      }
     } catch (err) {
       if (err instanceof SafeOpenError) {
         if (err.code === "invalid-path") {